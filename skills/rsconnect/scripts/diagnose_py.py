@@ -9,15 +9,20 @@ Exit codes: 0 = healthy, 1 = issues found
 
 import os
 import sys
+from datetime import datetime
+from pathlib import Path
 
 # Add lib/ to path for shared utilities
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
-UV_INSTALL_HINT = (
-    "uv not installed — install: powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\""
-    if sys.platform == "win32"
-    else "uv not installed — install: curl -LsSf https://astral.sh/uv/install.sh | sh"
+# Indexed by (sys.platform == "win32")
+_UV_INSTALL_HINTS = (
+    "uv not installed — install: curl -LsSf https://astral.sh/uv/install.sh | sh",
+    "uv not installed — install: powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\"",
 )
+UV_INSTALL_HINT = _UV_INSTALL_HINTS[sys.platform == "win32"]
+
+UVX_EXE = "uvx.exe" if sys.platform == "win32" else "uvx"
 
 
 from py_utils import (
@@ -27,19 +32,24 @@ from py_utils import (
     box_header,
     check_command,
     check_skill_dir_gitignored,
+    count_requirements_packages,
     get_local_python_version,
-    get_manifest_allow_uv,
-    get_manifest_content_type,
-    get_manifest_entrypoint,
     get_pyproject_requires_python,
     get_python_version_file,
     get_requirements_packages,
     is_exact_python_version,
-    parse_manifest_python_version,
+    load_manifest_view,
+    load_pyproject,
+    read_pyproject_text,
     run_command,
     skill_script_path,
 )
 
+# The report is only read once complete, so block-buffer stdout: on a
+# terminal it is line-buffered by default, costing one write per line.
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False)
+
 # Parse arguments
 args = sys.argv[1:]
 verbose = "--verbose" in args or "-v" in args
@@ -60,6 +70,20 @@ if help_requested:
 
 issues = []
 
+# Key files checked below. Stat them once up front from a single directory
+# scan and reuse the results in every section instead of re-probing.
+files = [
+    "requirements.txt",
+    "manifest.json",
+    "pyproject.toml",
+    ".python-version",
+    "uv.lock",
+    ".rscignore",
+]
+with os.scandir(".") as it:
+    entries = {e.name: e for e in it if e.is_file()}
+info = {name: entries[name].stat() for name in files if name in entries}
+
 box_header("PYTHON DEPLOYMENT DIAGNOSTICS")
 
 # Section 1: Environment info
@@ -83,9 +107,22 @@ else:
 print(f"Python path: {sys.executable}")
 print(f"Working dir: {os.getcwd()}")
 
+# Tool versions: run the version probes concurrently so this section
+# costs one process startup instead of the sum of all of them.
+# Imported here, not at the top, so --help doesn't pay for it.
+from concurrent.futures import ThreadPoolExecutor
+
+uv_path = check_command("uv")
+rsconnect_path = check_command("rsconnect")
+with ThreadPoolExecutor(max_workers=2) as pool:
+    uv_future = pool.submit(run_command, ["uv", "--version"]) if uv_path else None
+    rsconnect_future = pool.submit(run_command, ["rsconnect", "version"]) if rsconnect_path else None
+    uv_result = uv_future.result() if uv_future else None
+    rsconnect_result = rsconnect_future.result() if rsconnect_future else None
+
 # uv version
-if check_command("uv"):
-    result = run_command(["uv", "--version"])
+if uv_result is not None:
+    result = uv_result
     if result.returncode == 0:
         print(f"uv version: {result.stdout.strip()}")
     else:
@@ -95,13 +132,16 @@ else:
     issues.append(UV_INSTALL_HINT)
 
 # rsconnect-python version
-if check_command("rsconnect"):
-    result = run_command(["rsconnect", "version"])
+if rsconnect_result is not None:
+    result = rsconnect_result
     if result.returncode == 0:
         print(f"rsconnect-python: {result.stdout.strip()}")
     else:
         print("rsconnect-python: installed (couldn't get version)")
-elif check_command("uvx"):
+elif (
+    # uvx ships alongside uv, so look next to it before walking PATH again
+    uv_path and os.path.exists(os.path.join(os.path.dirname(uv_path), UVX_EXE))
+) or check_command("uvx"):
     print(f"{SYM_WARN} rsconnect-python: not installed (uvx available as fallback)")
 else:
     print("rsconnect-python: NOT INSTALLED")
@@ -125,19 +165,9 @@ print()
 
 # Section 2: Key files
 print("--- Key Files ---")
-files = [
-    "requirements.txt",
-    "manifest.json",
-    "pyproject.toml",
-    ".python-version",
-    "uv.lock",
-    ".rscignore",
-]
-
 for f in files:
-    if os.path.exists(f):
-        from datetime import datetime
-        mtime = os.path.getmtime(f)
+    if f in info:
+        mtime = info[f].st_mtime
         mtime_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
         print(f"{SYM_CHECK} {f} ( {mtime_str} )")
     else:
@@ -151,11 +181,12 @@ print()
 
 # Section 3: Manifest details
 print("--- Manifest Details ---")
-if os.path.exists("manifest.json"):
-    manifest_py_ver = parse_manifest_python_version()
-    content_type = get_manifest_content_type()
-    entrypoint = get_manifest_entrypoint()
-    allow_uv = get_manifest_allow_uv()
+if "manifest.json" in info:
+    manifest = load_manifest_view()
+    manifest_py_ver = manifest.python_version if manifest else None
+    content_type = manifest.content_type if manifest else None
+    entrypoint = manifest.entrypoint if manifest else None
+    allow_uv = manifest.allow_uv if manifest else None
 
     print(f"Python version: {manifest_py_ver or 'not set'}")
     print(f"Content type: {content_type or 'not set'}")
@@ -189,14 +220,16 @@ print()
 
 # Section 4: Requirements details
 print("--- Requirements ---")
-if os.path.exists("requirements.txt"):
-    pkgs = get_requirements_packages("requirements.txt")
-    print(f"Package count: {len(pkgs)}")
-
-    if verbose and pkgs:
-        print("\nPackages:")
-        for pkg in pkgs:
-            print(f"  - {pkg}")
+if "requirements.txt" in info:
+    if verbose:
+        pkgs = get_requirements_packages("requirements.txt")
+        print(f"Package count: {len(pkgs)}")
+        if pkgs:
+            print("\nPackages:")
+            for pkg in pkgs:
+                print(f"  - {pkg}")
+    else:
+        print(f"Package count: {count_requirements_packages('requirements.txt')}")
 else:
     print("No requirements.txt found")
 
@@ -204,19 +237,24 @@ print()
 
 # Section 5: pyproject.toml check
 print("--- Project Configuration ---")
-if os.path.exists("pyproject.toml"):
+if "pyproject.toml" in info:
     print(f"{SYM_CHECK} pyproject.toml found")
     if verbose:
-        try:
-            with open("pyproject.toml") as f:
-                content = f.read()
-            # Show project name and version if present
-            for line in content.split("\n"):
-                line_stripped = line.strip()
-                if line_stripped.startswith("name") or line_stripped.startswith("version"):
-                    print(f"  {line_stripped}")
-        except OSError:
-            pass
+        # Show project name and version if present
+        data = load_pyproject()
+        if data is not None:
+            project = data.get("project")
+            if isinstance(project, dict):
+                for key in ("name", "version"):
+                    if project.get(key):
+                        print(f'  {key} = "{project[key]}"')
+        else:
+            content = read_pyproject_text()
+            if content is not None:
+                for line in content.split("\n"):
+                    line_stripped = line.strip()
+                    if line_stripped.startswith("name") or line_stripped.startswith("version"):
+                        print(f"  {line_stripped}")
 else:
     print(f"{SYM_WARN} No pyproject.toml — uv projects require this")
 
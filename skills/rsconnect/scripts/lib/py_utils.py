@@ -8,65 +8,78 @@ Mirrors the patterns from parse_utils.R:
 - Manifest and requirements.txt parsing
 """
 
+import functools
 import io
-import json
 import re
 import os
-import shutil
-import subprocess
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# json, shutil and subprocess are imported where they're used so scripts
+# that only need output helpers don't pay for them at startup.
+if TYPE_CHECKING:
+    import subprocess
 
 # Force UTF-8 stdout/stderr on Windows where the default codepage (cp1252)
 # can't encode box-drawing characters or check-mark symbols.
 if sys.platform == "win32":
-    if not isinstance(sys.stdout, io.TextIOWrapper) or sys.stdout.encoding.lower().replace("-", "") != "utf8":
-        try:
-            sys.stdout.reconfigure(encoding="utf-8")
-        except (AttributeError, OSError):
-            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-    if not isinstance(sys.stderr, io.TextIOWrapper) or sys.stderr.encoding.lower().replace("-", "") != "utf8":
+    for _stream_name in ("stdout", "stderr"):
+        _stream = getattr(sys, _stream_name)
+        if _stream is None or (getattr(_stream, "encoding", "") or "").lower() in ("utf-8", "utf8"):
+            continue
         try:
-            sys.stderr.reconfigure(encoding="utf-8")
-        except (AttributeError, OSError):
-            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
+            _stream.reconfigure(encoding="utf-8")
+        except OSError:
+            setattr(sys, _stream_name, io.TextIOWrapper(_stream.buffer, encoding="utf-8", errors="replace"))
+    del _stream_name, _stream
 
 # Unicode symbols for consistent output (matches R scripts)
 SYM_CHECK = "\u2713"  # check mark
 SYM_CROSS = "\u2717"  # cross mark
 SYM_WARN = "\u26a0"   # warning sign
 
+# Exact pin in a requirement spec, e.g. "pkg==1.2" (see _requirements_to_dependencies)
+_PIN_RE = re.compile(r"==(\d)")
+# major.minor.patch with all three parts numeric (see is_exact_python_version)
+_EXACT_PY_VERSION_RE = re.compile(r"\d+\.\d+\.\d+(?:\.|\Z)")
+# Characters not allowed in a PEP 508 project name (see generate_pyproject_toml)
+_NAME_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9._-]")
+
+
+@functools.lru_cache(maxsize=8)
+def _box_edges(width: int) -> tuple[str, str]:
+    """Return the (top, bottom) box borders for a given width."""
+    rule = "\u2550" * (width - 2)
+    return "\u2554" + rule + "\u2557", "\u255a" + rule + "\u255d"
+
 
 def box_header(title: str, width: int = 40) -> None:
     """Print a boxed header for script output (matches R box_header)."""
     title = title[:width - 4]
     padding = width - len(title) - 4
-
-    print()
-    print("\u2554" + "\u2550" * (width - 2) + "\u2557")
-    print("\u2551  " + title + " " * padding + "\u2551")
-    print("\u255a" + "\u2550" * (width - 2) + "\u255d")
-    print()
+    top, bottom = _box_edges(width)
+    print("\n".join(("", top, f"\u2551  {title}{' ' * padding}\u2551", bottom, "")))
 
 
 def box_result(success: bool, width: int = 40) -> None:
     """Print a boxed result (matches R box_result)."""
-    print()
-    print("\u2554" + "\u2550" * (width - 2) + "\u2557")
     if success:
         msg = f"{SYM_CHECK} READY TO DEPLOY"
     else:
         msg = f"{SYM_CROSS} ISSUES FOUND"
     padding = max(0, width - len(msg) - 4)
-    print("\u2551  " + msg + " " * padding + "\u2551")
-    print("\u255a" + "\u2550" * (width - 2) + "\u255d")
+    top, bottom = _box_edges(width)
+    print("\n".join(("", top, f"\u2551  {msg}{' ' * padding}\u2551", bottom)))
 
 
+@functools.lru_cache(maxsize=1)
 def get_script_dir() -> Path:
     """Get the directory of the currently running script.
 
     Uses the *unresolved* argv[0] so the returned path matches
     what the user typed (e.g. .cursor/skills/... not a resolved symlink).
+    Cached, since argv[0] doesn't change during a run.
     """
     if sys.argv[0]:
         script_path = Path(sys.argv[0]).absolute()
@@ -75,6 +88,7 @@ def get_script_dir() -> Path:
     return Path.cwd()
 
 
+@functools.lru_cache(maxsize=8)
 def get_skill_root(from_dir: Path | None = None) -> Path:
     """Get the skill root directory (agent-agnostic).
 
@@ -109,19 +123,25 @@ def skill_script_path(script_name: str, from_dir: Path | None = None) -> str:
         return str(full_path)
 
 
+@functools.lru_cache(maxsize=None)
 def check_command(cmd: str) -> str | None:
     """Check if a CLI command is available.
 
-    Returns the path to the command, or None if not found.
+    Returns the path to the command, or None if not found. Results are
+    cached for the life of the process since PATH doesn't change mid-run.
     """
+    import shutil
+
     return shutil.which(cmd)
 
 
-def run_command(cmd: list[str], capture: bool = True) -> subprocess.CompletedProcess:
+def run_command(cmd: list[str], capture: bool = True) -> "subprocess.CompletedProcess":
     """Run a subprocess command, returning the result.
 
     Raises subprocess.CalledProcessError on non-zero exit.
     """
+    import subprocess
+
     return subprocess.run(
         cmd,
         capture_output=capture,
@@ -130,43 +150,96 @@ def run_command(cmd: list[str], capture: bool = True) -> subprocess.CompletedPro
     )
 
 
-def parse_manifest(manifest_path: str = "manifest.json") -> dict | None:
-    """Parse manifest.json, returning the parsed dict or None on error."""
+@functools.lru_cache(maxsize=8)
+def _load_manifest(path: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse manifest.json, cached on (path, mtime_ns, size)."""
+    import json
+
     try:
-        with open(manifest_path) as f:
+        with open(path) as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
 
-def parse_manifest_python_version(manifest_path: str = "manifest.json") -> str | None:
-    """Read the Python version from manifest.json.
+def parse_manifest(manifest_path: str = "manifest.json") -> dict | None:
+    """Parse manifest.json, returning the parsed dict or None on error.
 
-    Returns version string (e.g. '3.11.5') or None.
+    Results are cached per path and invalidated when the file's mtime
+    or size changes (e.g. after patch_allow_uv rewrites it).
+    """
+    try:
+        st = os.stat(manifest_path)
+    except OSError:
+        return None
+    return _load_manifest(manifest_path, st.st_mtime_ns, st.st_size)
+
+
+class ManifestView:
+    """The manifest.json fields the scripts report on, read in one pass.
+
+    A plain __slots__ class: importing dataclasses would cost more at
+    startup than all of the scripts' manifest handling.
+    """
+
+    __slots__ = ("python_version", "allow_uv", "content_type", "entrypoint")
+
+    def __init__(
+        self,
+        python_version: str | None,
+        allow_uv: bool | None,
+        content_type: str | None,
+        entrypoint: str | None,
+    ) -> None:
+        self.python_version = python_version
+        self.allow_uv = allow_uv
+        self.content_type = content_type
+        self.entrypoint = entrypoint
+
+    @classmethod
+    def from_manifest(cls, manifest: dict) -> "ManifestView":
+        # `or {}` only allocates on a miss, and also covers explicit nulls
+        python_section = manifest.get("python") or {}
+        metadata = manifest.get("metadata") or {}
+        pkg_manager = python_section.get("package_manager") or {}
+        return cls(
+            python_version=python_section.get("version"),
+            allow_uv=pkg_manager.get("allow_uv"),
+            content_type=metadata.get("content_type") or metadata.get("appmode"),
+            entrypoint=metadata.get("entrypoint"),
+        )
+
+
+def load_manifest_view(manifest_path: str = "manifest.json") -> ManifestView | None:
+    """Parse manifest.json once and return its commonly used fields.
+
+    Returns None if the manifest is missing or invalid.
     """
     manifest = parse_manifest(manifest_path)
     if manifest is None:
         return None
-    python_section = manifest.get("python", {})
-    return python_section.get("version")
+    return ManifestView.from_manifest(manifest)
+
+
+def parse_manifest_python_version(manifest_path: str = "manifest.json") -> str | None:
+    """Read the Python version from manifest.json.
+
+    Returns version string (e.g. '3.11.5') or None.
+    """
+    view = load_manifest_view(manifest_path)
+    return view.python_version if view else None
 
 
 def get_manifest_content_type(manifest_path: str = "manifest.json") -> str | None:
     """Read the content type from manifest.json metadata."""
-    manifest = parse_manifest(manifest_path)
-    if manifest is None:
-        return None
-    metadata = manifest.get("metadata", {})
-    return metadata.get("content_type") or metadata.get("appmode")
+    view = load_manifest_view(manifest_path)
+    return view.content_type if view else None
 
 
 def get_manifest_entrypoint(manifest_path: str = "manifest.json") -> str | None:
     """Read the entrypoint from manifest.json metadata."""
-    manifest = parse_manifest(manifest_path)
-    if manifest is None:
-        return None
-    metadata = manifest.get("metadata", {})
-    return metadata.get("entrypoint")
+    view = load_manifest_view(manifest_path)
+    return view.entrypoint if view else None
 
 
 def get_manifest_allow_uv(manifest_path: str = "manifest.json") -> bool | None:
@@ -174,14 +247,8 @@ def get_manifest_allow_uv(manifest_path: str = "manifest.json") -> bool | None:
 
     Returns True/False if explicitly set, None if field is missing.
     """
-    manifest = parse_manifest(manifest_path)
-    if manifest is None:
-        return None
-    python_section = manifest.get("python", {})
-    pkg_manager = python_section.get("package_manager", {})
-    if "allow_uv" in pkg_manager:
-        return pkg_manager["allow_uv"]
-    return None
+    view = load_manifest_view(manifest_path)
+    return view.allow_uv if view else None
 
 
 def get_requirements_packages(req_path: str = "requirements.txt") -> list[str]:
@@ -194,7 +261,7 @@ def get_requirements_packages(req_path: str = "requirements.txt") -> list[str]:
         with open(req_path) as f:
             for line in f:
                 line = line.strip()
-                if not line or line.startswith("#") or line.startswith("-"):
+                if not line or line.startswith(("#", "-")):
                     continue
                 packages.append(line)
     except FileNotFoundError:
@@ -202,6 +269,41 @@ def get_requirements_packages(req_path: str = "requirements.txt") -> list[str]:
     return packages
 
 
+def count_requirements_packages(req_path: str = "requirements.txt") -> int:
+    """Count package specs in requirements.txt without building a list.
+
+    Uses the same filtering as get_requirements_packages().
+    """
+    try:
+        with open(req_path) as f:
+            return sum(1 for line in f if (s := line.strip()) and not s.startswith(("#", "-")))
+    except FileNotFoundError:
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _load_gitignore_entries(gitignore_path: str = ".gitignore") -> frozenset[str] | None:
+    """Return the active (non-blank, non-comment, non-negated) .gitignore lines.
+
+    Returns None if the file doesn't exist.
+    """
+    try:
+        with open(gitignore_path) as f:
+            lines = (line.strip() for line in f)
+            return frozenset(line for line in lines if line and not line.startswith(("#", "!")))
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _agent_dir_pattern(agent_dir: str) -> re.Pattern[str]:
+    """Compile the .gitignore pattern matching agent_dir at any depth.
+
+    Multiline so one search() covers newline-joined .gitignore entries.
+    """
+    return re.compile(rf"(^|.*/){re.escape(agent_dir)}(/|$)", re.MULTILINE)
+
+
 def check_skill_dir_gitignored() -> tuple[bool, str | None]:
     """Check if the agent skill directory is listed in .gitignore.
 
@@ -228,24 +330,17 @@ def check_skill_dir_gitignored() -> tuple[bool, str | None]:
         return True, None  # Not a hidden agent dir — skip
 
     # Check .gitignore
-    gitignore_path = Path(".gitignore")
-    if not gitignore_path.exists():
+    entries = _load_gitignore_entries()
+    if entries is None:
         return False, agent_dir
 
-    gitignore_content = gitignore_path.read_text()
-    agent_pattern = re.compile(rf"(^|.*/){re.escape(agent_dir)}(/|$)")
-    # Check for the directory with or without trailing slash or common glob patterns
-    for line in gitignore_content.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or line.startswith("!"):
-            continue
-        if line in (agent_dir, agent_dir + "/", f"/{agent_dir}", f"/{agent_dir}/"):
-            return True, agent_dir
-        normalized = line.rstrip("/")
-        if normalized in (agent_dir, f"/{agent_dir}"):
-            return True, agent_dir
-        if agent_pattern.search(line):
-            return True, agent_dir
+    # Check for the directory with or without trailing slash
+    if not entries.isdisjoint((agent_dir, agent_dir + "/", f"/{agent_dir}", f"/{agent_dir}/")):
+        return True, agent_dir
+
+    # Fall back to nested paths and common glob patterns
+    if _agent_dir_pattern(agent_dir).search("\n".join(entries)):
+        return True, agent_dir
 
     return False, agent_dir
 
@@ -255,8 +350,7 @@ def is_exact_python_version(version: str) -> bool:
 
     Examples: '3.13.6' -> True, '3.13' -> False, '3' -> False.
     """
-    parts = version.split(".")
-    return len(parts) >= 3 and all(p.isdigit() for p in parts[:3])
+    return _EXACT_PY_VERSION_RE.match(version) is not None
 
 
 def get_python_version_file() -> str | None:
@@ -265,49 +359,101 @@ def get_python_version_file() -> str | None:
     Returns the version string as written in the file, or None if
     the file doesn't exist or is empty.
     """
-    pv_file = Path(".python-version")
-    if pv_file.exists():
-        version = pv_file.read_text().strip()
-        if version:
-            return version
-    return None
+    try:
+        with open(".python-version") as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return version or None
 
 
-def get_pyproject_requires_python() -> str | None:
-    """Read requires-python from pyproject.toml.
+@functools.lru_cache(maxsize=1)
+def _read_pyproject(path: str, mtime_ns: int) -> str:
+    """Read pyproject.toml text, cached on (path, mtime_ns)."""
+    with open(path) as f:
+        return f.read()
 
-    Returns the constraint string (e.g. '>=3.12', '==3.13.6') or None.
+
+def read_pyproject_text(path: str = "pyproject.toml") -> str | None:
+    """Read the raw text of pyproject.toml, or None if it's missing.
+
+    The contents are cached until the file's mtime changes, so several
+    sections of a script can read it without re-opening the file.
     """
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
+    try:
+        return _read_pyproject(path, os.stat(path).st_mtime_ns)
+    except OSError:
         return None
 
+
+@functools.lru_cache(maxsize=1)
+def _import_tomllib():
+    """Return the tomllib module (or tomli backport), or None if unavailable."""
+    # tomllib is stdlib in 3.11+
     try:
-        # tomllib is stdlib in 3.11+; fall back to parsing manually
+        import tomllib
+    except ImportError:
         try:
-            import tomllib
+            import tomli as tomllib  # type: ignore[no-redef]
         except ImportError:
-            try:
-                import tomli as tomllib  # type: ignore[no-redef]
-            except ImportError:
-                # Manual fallback: scan for requires-python
-                content = pyproject_path.read_text()
-                for line in content.splitlines():
-                    line = line.strip()
-                    if line.startswith("requires-python"):
-                        _, _, value = line.partition("=")
-                        # Strip the first '=' from e.g. '= ">=3.12"'
-                        value = value.lstrip("= ").strip().strip('"').strip("'")
-                        if value:
-                            return value
-                return None
-
-        data = tomllib.loads(pyproject_path.read_text())
-        return data.get("project", {}).get("requires-python")
+            return None
+    return tomllib
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_pyproject(path: str, mtime_ns: int) -> dict | None:
+    """Parse pyproject.toml, cached on (path, mtime_ns)."""
+    tomllib = _import_tomllib()
+    if tomllib is None:
+        return None
+    try:
+        return tomllib.loads(_read_pyproject(path, mtime_ns))
     except Exception:
         return None
 
 
+def load_pyproject(path: str = "pyproject.toml") -> dict | None:
+    """Parse pyproject.toml into a dict.
+
+    Returns None if the file is missing or invalid, or if no TOML parser
+    is available. Parsed once until the file's mtime changes.
+    """
+    try:
+        return _parse_pyproject(path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def get_pyproject_requires_python() -> str | None:
+    """Read requires-python from pyproject.toml.
+
+    Returns the constraint string (e.g. '>=3.12', '==3.13.6') or None.
+    """
+    if _import_tomllib() is not None:
+        data = load_pyproject()
+        if data is None:
+            return None
+        project = data.get("project")
+        if not isinstance(project, dict):
+            return None
+        return project.get("requires-python")
+
+    content = read_pyproject_text()
+    if content is None:
+        return None
+
+    # Manual fallback: scan for requires-python
+    for line in content.splitlines():
+        line = line.strip()
+        if line.startswith("requires-python"):
+            _, _, value = line.partition("=")
+            # Strip the first '=' from e.g. '= ">=3.12"'
+            value = value.lstrip("= ").strip().strip('"').strip("'")
+            if value:
+                return value
+    return None
+
+
 def generate_pyproject_toml(
     project_name: str | None = None,
     python_version: str | None = None,
@@ -322,12 +468,10 @@ def generate_pyproject_toml(
 
     Returns the file content as a string.
     """
-    import re
-
     if project_name is None:
         project_name = Path.cwd().name
     # PEP 508: lowercase, alphanumeric + hyphens
-    project_name = re.sub(r"[^a-zA-Z0-9._-]", "-", project_name).lower().strip("-")
+    project_name = _NAME_SANITIZE_RE.sub("-", project_name).lower().strip("-")
 
     if python_version is None:
         python_version = get_python_version_file()
@@ -362,14 +506,12 @@ def _requirements_to_dependencies(req_path: str = "requirements.txt") -> list[st
     Strips exact pins (==) to minimum bounds (>=) so pyproject.toml has
     loose constraints while requirements.txt/uv.lock keep the pins.
     """
-    import re
-
     deps = []
     for spec in get_requirements_packages(req_path):
         # Strip hashes, environment markers after ;
         spec = spec.split(";")[0].strip()
         # Convert == pins to >= (pyproject.toml should be loose)
-        spec = re.sub(r"==(\d)", r">=\1", spec)
+        spec = _PIN_RE.sub(r">=\1", spec)
         if spec:
             deps.append(spec)
     return deps
@@ -9,9 +9,10 @@ Exit codes: 0 = ready to deploy, 1 = issues found
 
 import os
 import sys
+from pathlib import Path
 
 # Add lib/ to path for shared utilities
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+sys.path.insert(0, str(Path(__file__).parent / "lib"))
 
 UV_INSTALL_HINT = (
     "Install uv: powershell -ExecutionPolicy ByPass -c \"irm https://astral.sh/uv/install.ps1 | iex\""
@@ -28,20 +29,26 @@ from py_utils import (
     box_result,
     check_command,
     check_skill_dir_gitignored,
+    count_requirements_packages,
     get_local_python_version,
-    get_manifest_allow_uv,
     get_pyproject_requires_python,
     get_python_version_file,
-    get_requirements_packages,
     is_exact_python_version,
-    parse_manifest_python_version,
+    load_manifest_view,
     skill_script_path,
 )
 
 passed = True
 issues = []
 warnings = []
-script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# One directory scan up front; checks below test membership in it
+# instead of each issuing their own stat() calls.
+with os.scandir(".") as it:
+    entries = {e.name: e for e in it if e.is_file()}
+
+# Parse manifest.json once; checks 7 and 9 read fields from this view.
+manifest = load_manifest_view()
 
 box_header("PYTHON PRE-DEPLOY CHECK")
 
@@ -54,7 +61,7 @@ if not is_ignored and agent_dir:
 
 # Check 1: pyproject.toml exists
 print("1. Project file... ", end="")
-if os.path.exists("pyproject.toml"):
+if "pyproject.toml" in entries:
     requires_py = get_pyproject_requires_python()
     if requires_py:
         print(f"{SYM_CHECK} pyproject.toml (requires-python: {requires_py})")
@@ -70,7 +77,7 @@ else:
 
 # Check 2: manifest.json exists
 print("2. Manifest file... ", end="")
-if os.path.exists("manifest.json"):
+if "manifest.json" in entries:
     print(f"{SYM_CHECK} Present")
 else:
     print(f"{SYM_CROSS} MISSING")
@@ -79,9 +86,9 @@ else:
 
 # Check 3: requirements.txt exists
 print("3. Requirements file... ", end="")
-if os.path.exists("requirements.txt"):
-    pkgs = get_requirements_packages("requirements.txt")
-    print(f"{SYM_CHECK} Present ({len(pkgs)} packages)")
+if "requirements.txt" in entries:
+    pkg_count = count_requirements_packages("requirements.txt")
+    print(f"{SYM_CHECK} Present ({pkg_count} packages)")
 else:
     print(f"{SYM_CROSS} MISSING")
     issues.append("Run: uv export --no-hashes -o requirements.txt")
@@ -132,7 +139,7 @@ else:
 
 # Check 7: Python version in manifest matches local
 print("7. Python version match... ", end="")
-manifest_version = parse_manifest_python_version()
+manifest_version = manifest.python_version if manifest else None
 local_version = get_local_python_version()
 
 if manifest_version and local_version:
@@ -157,16 +164,16 @@ if manifest_version and local_version:
             )
 elif manifest_version:
     print(f"? Manifest says {manifest_version}, couldn't detect local")
-elif os.path.exists("manifest.json"):
+elif "manifest.json" in entries:
     print("? No Python version in manifest")
 else:
     print("- Skipped (no manifest)")
 
 # Check 8: Manifest freshness (newer than requirements.txt)
 print("8. Manifest freshness... ", end="")
-if os.path.exists("manifest.json") and os.path.exists("requirements.txt"):
-    manifest_mtime = os.path.getmtime("manifest.json")
-    req_mtime = os.path.getmtime("requirements.txt")
+if "manifest.json" in entries and "requirements.txt" in entries:
+    manifest_mtime = entries["manifest.json"].stat().st_mtime_ns
+    req_mtime = entries["requirements.txt"].stat().st_mtime_ns
 
     if manifest_mtime >= req_mtime:
         print(f"{SYM_CHECK} Manifest is up to date")
@@ -180,13 +187,13 @@ else:
 
 # Check 9: allow_uv in manifest (informational)
 print("9. allow_uv in manifest... ", end="")
-allow_uv = get_manifest_allow_uv()
+allow_uv = manifest.allow_uv if manifest else None
 if allow_uv is True:
     print(f"{SYM_CHECK} Enabled")
 elif allow_uv is False:
     print(f"{SYM_WARN} Explicitly disabled")
     warnings.append("allow_uv is false — Connect will use pip instead of uv")
-elif os.path.exists("manifest.json"):
+elif "manifest.json" in entries:
     print(f"{SYM_WARN} Not set (Connect uses server default)")
     warnings.append(
         "Set allow_uv: true in manifest for faster installs — "
@@ -12,13 +12,22 @@ Exit codes: 0 = success, 1 = failed
 """
 
 import argparse
+import functools
 import json
 import os
 import re
 import sys
+from collections.abc import Iterator
+from pathlib import Path
 
 # Add lib/ to path for shared utilities
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+sys.path.insert(0, str(Path(__file__).parent / "lib"))
+
+# orjson is optional: faster JSON parsing when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from py_utils import (
     SYM_CHECK,
@@ -31,49 +40,87 @@ from py_utils import (
     get_local_python_version,
     get_python_version_file,
     is_exact_python_version,
+    load_pyproject,
+    read_pyproject_text,
     run_command,
     skill_script_path,
 )
 
 CONTENT_TYPES = ["api", "fastapi", "flask", "dash", "streamlit", "bokeh", "notebook"]
 
+# Framework import patterns -> content type, in priority order when a file
+# imports several. Compiled once and searched separately: one big
+# alternation is slower here, and its matches consume text another
+# framework's pattern needs (`from dash import flask_caching`). Bytes
+# patterns: entrypoints are searched without decoding.
+_FRAMEWORK_PATTERNS = (
+    (re.compile(rb"from\s+fastapi\s+import|import\s+fastapi"), "fastapi"),
+    (re.compile(rb"from\s+flask\s+import|import\s+flask"), "flask"),
+    (re.compile(rb"from\s+dash\s+import|import\s+dash"), "dash"),
+    (re.compile(rb"from\s+streamlit|import\s+streamlit"), "streamlit"),
+    (re.compile(rb"from\s+bokeh|import\s+bokeh"), "bokeh"),
+    (re.compile(rb"from\s+shiny\s+import|import\s+shiny"), "api"),  # Shiny for Python uses api type
+)
+# Entrypoint file names, in the order they are tried
+_ENTRYPOINT_CANDIDATES = (
+    "app.py",
+    "main.py",
+    "api.py",
+    "application.py",
+    "server.py",
+    "wsgi.py",
+    "asgi.py",
+)
+_ENTRYPOINT_SET = frozenset(_ENTRYPOINT_CANDIDATES)
+# Directories never searched for packages (dot-directories are skipped too)
+_SKIP_DIRS = frozenset({
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".git",
+    "node_modules",
+    ".tox",
+    ".mypy_cache",
+    ".pytest_cache",
+})
+# Files whose mtimes decide whether a previous uv export is still current
+_EXPORT_INPUTS = ("uv.lock", "pyproject.toml", "requirements.txt")
+
+# How much of an entrypoint to scan for framework imports (they sit near the top)
+_SCAN_BYTES = 64 * 1024
+
+# A [section] header or a `key = "string"` line (fallback pyproject parsing)
+_TOML_LINE_RE = re.compile(
+    r"""^[ \t]*(?:\[(?P<sec>[^\]\n]+)\]|(?P<key>[\w.-]+)[ \t]*=[ \t]*["'](?P<val>[^"'\n]*)["'])""",
+    re.MULTILINE,
+)
 
-def _parse_pyproject() -> dict | None:
-    if not os.path.exists("pyproject.toml"):
-        return None
-    try:
-        import tomllib
-    except ImportError:
-        return None
-    try:
-        with open("pyproject.toml", "rb") as f:
-            return tomllib.load(f)
-    except Exception:
-        return None
+
+def _scan_pyproject_values() -> Iterator[tuple[str, str, str]]:
+    """Yield (section, key, value) for simple `key = "value"` lines.
+
+    Minimal stand-in for tomllib on Pythons without it; reads the cached
+    pyproject.toml text once and tracks the current [section] header.
+    """
+    content = read_pyproject_text()
+    if content is None:
+        return
+    section = ""
+    for m in _TOML_LINE_RE.finditer(content):
+        if m["sec"] is not None:
+            section = m["sec"].strip()
+        else:
+            yield section, m["key"], m["val"]
 
 
 def _parse_pyproject_name() -> str | None:
-    data = _parse_pyproject()
-    if data:
-        name = data.get("project", {}).get("name")
-        if name:
-            return name
-    try:
-        in_project = False
-        with open("pyproject.toml") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("["):
-                    in_project = line == "[project]"
-                    continue
-                if not in_project or not line.startswith("name"):
-                    continue
-                _, _, value = line.partition("=")
-                value = value.strip().strip('"').strip("'")
-                if value:
-                    return value
-    except OSError:
-        pass
+    data = load_pyproject()
+    if data is not None:
+        return data.get("project", {}).get("name") or None
+    # No TOML parser available (or invalid TOML): scan lines instead
+    for section, key, value in _scan_pyproject_values():
+        if section == "project" and key == "name" and value:
+            return value
     return None
 
 
@@ -86,8 +133,8 @@ def _parse_pyproject_entrypoints() -> list[str]:
             target.append(module)
 
     modules: list[str] = []
-    data = _parse_pyproject()
-    if data:
+    data = load_pyproject()
+    if data is not None:
         project = data.get("project", {})
         scripts = project.get("scripts", {})
         if isinstance(scripts, dict):
@@ -101,52 +148,76 @@ def _parse_pyproject_entrypoints() -> list[str]:
                     for value in group.values():
                         if isinstance(value, str):
                             add_module(modules, value)
-        if modules:
-            return modules
-
-    if not os.path.exists("pyproject.toml"):
         return modules
 
-    try:
-        in_section = False
-        with open("pyproject.toml") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("["):
-                    in_section = line.startswith("[project.scripts]") or line.startswith("[project.entry-points.")
-                    continue
-                if not in_section or "=" not in line:
-                    continue
-                _, _, value = line.partition("=")
-                value = value.strip().strip('"').strip("'")
-                add_module(modules, value)
-    except OSError:
-        pass
+    # No TOML parser available (or invalid TOML): scan lines instead
+    for section, _, value in _scan_pyproject_values():
+        if section == "project.scripts" or section.startswith("project.entry-points."):
+            add_module(modules, value)
 
     return modules
 
 
-def _module_to_paths(module: str) -> list[str]:
+@functools.lru_cache(maxsize=256)
+def _module_to_paths(module: str) -> tuple[str, str]:
     rel = module.replace(".", os.sep)
-    return [f"{rel}.py", os.path.join(rel, "__init__.py")]
+    return f"{rel}.py", os.path.join(rel, "__init__.py")
 
 
-def detect_content_type() -> str | None:
+def _scan_frameworks(path: str) -> str | None:
+    """Content type of the first framework imported in the first
+    _SCAN_BYTES of a file, by priority, or None."""
+    with open(path, "rb") as f:
+        buf = f.read(_SCAN_BYTES)
+    for pattern, content_type in _FRAMEWORK_PATTERNS:
+        if pattern.search(buf):
+            return content_type
+    return None
+
+
+def detect_content_type(touched: list[str] | None = None) -> str | None:
     """Auto-detect Python content type from project files.
 
-    Looks for common entrypoint files and framework imports.
+    Looks for common entrypoint files and framework imports. If `touched`
+    is given, every file and directory the result depends on is appended
+    to it (used to fingerprint the detection cache).
     """
-    candidates = [
-        "app.py",
-        "main.py",
-        "api.py",
-        "application.py",
-        "server.py",
-        "wsgi.py",
-        "asgi.py",
-    ]
+    if touched is None:
+        touched = []
+    touched.append("pyproject.toml")
     search_dirs: list[str] = []
     seen_dirs: set[str] = set()
+    listings: dict[str, list[os.DirEntry]] = {}
+    listing_names: dict[str, set[str]] = {}
+
+    def list_dir(path: str) -> list[os.DirEntry]:
+        # "." and "src" are needed by several passes below; read each once
+        norm = os.path.normpath(path)
+        if norm not in listings:
+            touched.append(norm)
+            try:
+                with os.scandir(norm) as it:
+                    listings[norm] = list(it)
+            except OSError:
+                listings[norm] = []
+            listing_names[norm] = {entry.name for entry in listings[norm]}
+        return listings[norm]
+
+    exists_cache: dict[str, bool] = {}
+
+    def path_exists(path: str) -> bool:
+        # Answer from a directory already listed when possible, and never
+        # stat the same path twice (hits and misses are both cached)
+        exists = exists_cache.get(path)
+        if exists is None:
+            parent, name = os.path.split(path)
+            parent = os.path.normpath(parent or ".")
+            if parent in listing_names:
+                exists = name in listing_names[parent]
+            else:
+                exists = os.path.exists(path)
+            exists_cache[path] = exists
+        return exists
 
     def add_dir(path: str) -> None:
         if not path:
@@ -154,6 +225,7 @@ def detect_content_type() -> str | None:
         norm = os.path.normpath(path)
         if norm in seen_dirs:
             return
+        touched.append(norm)
         if os.path.isdir(norm):
             search_dirs.append(norm)
             seen_dirs.add(norm)
@@ -168,28 +240,36 @@ def detect_content_type() -> str | None:
         add_dir(os.path.join("src", normalized))
 
     for base in [".", "src"]:
-        if not os.path.isdir(base):
-            continue
-        for entry in os.listdir(base):
-            if entry.startswith(".") or entry in {"__pycache__", ".venv", "venv", ".git"}:
+        for entry in list_dir(base):
+            if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
                 continue
-            path = os.path.join(base, entry)
-            if os.path.isdir(path) and os.path.isfile(os.path.join(path, "__init__.py")):
-                add_dir(path)
+            if not entry.is_dir():
+                continue
+            # Fingerprint the directory even when it isn't a package yet:
+            # adding __init__.py later changes its mtime, not the parent's
+            touched.append(os.path.normpath(entry.path))
+            if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                add_dir(entry.path)
 
     candidate_paths: list[str] = []
     seen_paths: set[str] = set()
 
-    def add_path(path: str) -> None:
+    def add_path(path: str, exists: bool = False) -> None:
         if not path or path in seen_paths:
             return
-        if os.path.exists(path):
+        touched.append(path)
+        if exists or path_exists(path):
             candidate_paths.append(path)
             seen_paths.add(path)
 
     for base in search_dirs:
-        for name in candidates:
-            add_path(os.path.join(base, name))
+        # One directory listing instead of a stat() per candidate name
+        names = {entry.name for entry in list_dir(base) if entry.is_file()}
+        if names.isdisjoint(_ENTRYPOINT_SET):
+            continue
+        for name in _ENTRYPOINT_CANDIDATES:
+            if name in names:
+                add_path(os.path.join(base, name), exists=True)
 
     for module in _parse_pyproject_entrypoints():
         for rel in _module_to_paths(module):
@@ -198,44 +278,151 @@ def detect_content_type() -> str | None:
 
     if not candidate_paths:
         for base in (".", "src", "notebooks"):
-            if not os.path.isdir(base):
-                continue
-            for entry in os.listdir(base):
-                if entry.endswith(".ipynb"):
+            if base in listings:
+                if any(entry.name.endswith(".ipynb") for entry in listings[base]):
                     return "notebook"
+                continue
+            # Not listed yet: scan lazily and stop at the first notebook
+            touched.append(base)
+            try:
+                with os.scandir(base) as it:
+                    if any(entry.name.endswith(".ipynb") for entry in it):
+                        return "notebook"
+            except OSError:
+                continue
         return None
 
     for entrypoint in candidate_paths:
         try:
-            with open(entrypoint, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            content_type = _scan_frameworks(entrypoint)
         except OSError:
             continue
-
-        if re.search(r"from\s+fastapi\s+import|import\s+fastapi", content):
-            return "fastapi"
-        if re.search(r"from\s+flask\s+import|import\s+flask", content):
-            return "flask"
-        if re.search(r"from\s+dash\s+import|import\s+dash", content):
-            return "dash"
-        if re.search(r"from\s+streamlit|import\s+streamlit", content):
-            return "streamlit"
-        if re.search(r"from\s+bokeh|import\s+bokeh", content):
-            return "bokeh"
-        if re.search(r"from\s+shiny\s+import|import\s+shiny", content):
-            return "api"  # Shiny for Python uses api type
+        if content_type:
+            return content_type
 
     return "api"
 
 
+def _json_loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: dict) -> str:
+    """Serialize with 2-space indent and a trailing newline.
+
+    Always the stdlib encoder, even when orjson is installed: manifest.json
+    is committed, so its bytes (ASCII escapes, float formatting) must not
+    depend on which packages happen to be installed. Callers write it in
+    text mode so line endings stay platform-native, as before.
+    """
+    return json.dumps(obj, indent=2) + "\n"
+
+
+def _cache_path() -> str:
+    """Location of the per-user cache (outside the project, so it never
+    ends up in the manifest or a commit)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "rsconnect-skill", "cache.json")
+
+
+def _load_cache() -> dict:
+    try:
+        with open(_cache_path(), "rb") as f:
+            cache = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _fingerprint(paths: list[str]) -> list[list]:
+    """[path, st_mtime_ns or None] for each unique path, in order."""
+    result = []
+    for path in dict.fromkeys(paths):
+        try:
+            result.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            result.append([path, None])
+    return result
+
+
+# Bump when a cache entry's meaning changes
+_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_stamp() -> list:
+    """Identify the code that produced a cache entry.
+
+    The cache version plus the mtimes of this script and py_utils, so
+    upgrading the skill (new candidates, patterns, export arguments)
+    invalidates entries even when no project file changed.
+    """
+    script = os.path.abspath(__file__)
+    lib = os.path.join(os.path.dirname(script), "lib", "py_utils.py")
+    return [_CACHE_VERSION, *(mtime for _, mtime in _fingerprint([script, lib]))]
+
+
+def _get_cache_entry(name: str) -> dict | None:
+    """Return this project's cached `name` entry if its inputs are unchanged."""
+    project = _load_cache().get(os.getcwd())
+    entry = project.get(name) if isinstance(project, dict) else None
+    if not isinstance(entry, dict) or not isinstance(entry.get("inputs"), list):
+        return None
+    if entry.get("stamp") != _cache_stamp():
+        return None
+    paths = [item[0] for item in entry["inputs"] if isinstance(item, list) and item]
+    return entry if _fingerprint(paths) == entry["inputs"] else None
+
+
+def _set_cache_entry(name: str, inputs: list[str], **values) -> None:
+    """Record `values` for this project, fingerprinted on the mtimes of `inputs`."""
+    cache = _load_cache()
+    project = cache.get(os.getcwd())
+    if not isinstance(project, dict):
+        project = cache[os.getcwd()] = {}
+    project[name] = {"stamp": _cache_stamp(), "inputs": _fingerprint(inputs), **values}
+
+    cache_path = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_json_dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def detect_content_type_cached(use_cache: bool = True) -> str | None:
+    """detect_content_type(), reusing the last result for this project.
+
+    The cached result is only used while every file and directory
+    detection looked at (pyproject.toml, uv.lock, search dirs,
+    entrypoints) still has the same mtime.
+    """
+    if use_cache:
+        entry = _get_cache_entry("detect")
+        if entry is not None:
+            return entry.get("type")
+
+    touched = ["uv.lock"]
+    content_type = detect_content_type(touched)
+    _set_cache_entry("detect", touched, type=content_type)
+    return content_type
+
+
 def patch_allow_uv(manifest_path: str = "manifest.json") -> bool:
     """Patch allow_uv: true into manifest.json python.package_manager section.
 
     Returns True if patched successfully, False on error.
     """
     try:
-        with open(manifest_path) as f:
-            manifest = json.load(f)
+        with open(manifest_path, "rb") as f:
+            manifest = _json_loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"  {SYM_CROSS} Failed to read manifest: {e}")
         return False
@@ -251,9 +438,8 @@ def patch_allow_uv(manifest_path: str = "manifest.json") -> bool:
     python_section["package_manager"]["allow_uv"] = True
 
     try:
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
-            f.write("\n")  # Trailing newline
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            f.write(_json_dumps(manifest))
     except OSError as e:
         print(f"  {SYM_CROSS} Failed to write manifest: {e}")
         return False
@@ -281,12 +467,19 @@ def main() -> None:
         action="store_true",
         help="Don't patch allow_uv: true into manifest",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-detect the content type and re-run uv export instead of reusing cached results",
+    )
     args = parser.parse_args()
 
     box_header("REGENERATE PYTHON MANIFEST")
 
     # Step 1: Check prerequisites and determine rsconnect command
-    if not check_command("rsconnect") and not check_command("uvx"):
+    # Probe once: uvx is preferred, installed rsconnect is the fallback
+    uvx_ok = check_command("uvx")
+    if not uvx_ok and not check_command("rsconnect"):
         print(f"{SYM_CROSS} rsconnect-python not installed and uvx not available")
         print("Install: uv tool install rsconnect-python")
         sys.exit(1)
@@ -318,24 +511,22 @@ def main() -> None:
     # gets stamped with the correct Python version (matching .python-version).
     # Note: the package is "rsconnect-python" but the executable is "rsconnect",
     # so uvx needs --from rsconnect-python rsconnect.
-    if check_command("uvx"):
-        rsconnect_cmd = [
+    if uvx_ok:
+        rsconnect_cmd = (
             "uvx", "--python", target_python,
             "--from", "rsconnect-python", "rsconnect",
-        ]
-        print(f"Target Python: {target_python} (via uvx --python)")
-    elif check_command("rsconnect"):
-        rsconnect_cmd = ["rsconnect"]
-        print(f"Target Python: {target_python} (using installed rsconnect)")
+        )
+        announce = f"Target Python: {target_python} (via uvx --python)"
     else:
-        print(f"{SYM_CROSS} rsconnect-python not installed and uvx not available")
-        sys.exit(1)
+        rsconnect_cmd = ("rsconnect",)
+        announce = f"Target Python: {target_python} (using installed rsconnect)"
+    print(announce)
 
     # Step 2: Detect content type
     content_type = args.type
     if content_type is None:
         print("Detecting content type... ", end="")
-        content_type = detect_content_type()
+        content_type = detect_content_type_cached(use_cache=not args.no_cache)
         if content_type:
             print(f"{SYM_CHECK} {content_type}")
         else:
@@ -368,13 +559,19 @@ def main() -> None:
                 print("  Create manually or use --no-uv-export with existing requirements.txt")
                 sys.exit(1)
 
-        result = run_command(["uv", "export", "--no-hashes", "-o", "requirements.txt"])
-        if result.returncode == 0:
-            print(f"{SYM_CHECK}")
+        # Skip the export when uv.lock, pyproject.toml and requirements.txt
+        # are all unchanged since the last successful one
+        if not args.no_cache and _get_cache_entry("export") is not None:
+            print(f"{SYM_CHECK} (up to date with uv.lock)")
         else:
-            print(f"{SYM_CROSS}")
-            print(f"  Error: {result.stderr.strip()}")
-            sys.exit(1)
+            result = run_command(["uv", "export", "--no-hashes", "-o", "requirements.txt"])
+            if result.returncode == 0:
+                print(f"{SYM_CHECK}")
+                _set_cache_entry("export", list(_EXPORT_INPUTS))
+            else:
+                print(f"{SYM_CROSS}")
+                print(f"  Error: {result.stderr.strip()}")
+                sys.exit(1)
     else:
         print("\nSkipping uv export (using existing requirements.txt)")
         if not os.path.exists("requirements.txt"):
@@ -388,7 +585,7 @@ def main() -> None:
         rsconnect_type = "api"  # Flask uses generic api type
 
     print(f"\nGenerating manifest.json ({rsconnect_type})... ", end="")
-    cmd = rsconnect_cmd + ["write-manifest", rsconnect_type, ".", "--overwrite"]
+    cmd = [*rsconnect_cmd, "write-manifest", rsconnect_type, ".", "--overwrite"]
     result = run_command(cmd)
 
     if result.returncode == 0: